@@ -1,6 +1,7 @@
 """Google Sheets synchronization functionality."""
 
 # Standard library
+from functools import cache
 from typing import Optional
 
 # Third-party
@@ -19,6 +20,22 @@ from src.constants.gsheets import (
 from src.common.utils import LOG
 
 
+@cache
+def _get_gs_client():
+    """Authorize against Google Sheets once per process.
+
+    pygsheets.authorize does an OAuth round-trip, so re-running it for
+    every read/write adds a TLS handshake and token exchange per call.
+    The credentials file is fixed for the process, so one client is
+    enough. The kwarg name changed across pygsheets versions; try the
+    current one first.
+    """
+    try:
+        return pygsheets.authorize(service_account_file=SHEETS_AUTHENTICATION_FILE)
+    except TypeError:
+        return pygsheets.authorize(service_file=SHEETS_AUTHENTICATION_FILE)
+
+
 def read_from_sheets(
     spreadsheet_key: str,
     worksheet_name: str,
@@ -38,7 +55,7 @@ def read_from_sheets(
         return None
 
     try:
-        gc = pygsheets.authorize(service_file=SHEETS_AUTHENTICATION_FILE)
+        gc = _get_gs_client()
         sheet = gc.open_by_key(spreadsheet_key)
         worksheet = sheet.worksheet_by_title(worksheet_name)
         df = worksheet.get_as_df(numerize=numerize, empty_value=None)
@@ -51,6 +68,53 @@ def read_from_sheets(
         return None
 
 
+def read_column_from_sheets(
+    spreadsheet_key: str,
+    worksheet_name: str,
+    column_name: str,
+) -> Optional[list]:
+    """Read a single column's values from a Google Sheets worksheet.
+
+    Fetches raw cell values and slices out one column, skipping the
+    DataFrame construction and per-column type inference that
+    read_from_sheets pays for when only one column is needed.
+
+    Args:
+        spreadsheet_key: Google Sheet key/ID
+        worksheet_name: Name of the worksheet to read from
+        column_name: Header name of the column to extract
+
+    Returns:
+        List of non-empty cell values below the header, or None if the
+        worksheet or column doesn't exist
+    """
+    if not spreadsheet_key or not worksheet_name:
+        return None
+
+    try:
+        gc = _get_gs_client()
+        sheet = gc.open_by_key(spreadsheet_key)
+        worksheet = sheet.worksheet_by_title(worksheet_name)
+        try:
+            values = worksheet.get_all_values(include_tailing_empty=False)
+        except TypeError:
+            values = worksheet.get_all_values()
+    except pygsheets.WorksheetNotFound:
+        LOG.debug("Worksheet '%s' not found in spreadsheet", worksheet_name)
+        return None
+    except Exception as e:
+        LOG.warning("Error reading worksheet '%s': %s", worksheet_name, str(e))
+        return None
+
+    if not values:
+        return None
+    header = values[0]
+    if column_name not in header:
+        return None
+    col_idx = header.index(column_name)
+    return [row[col_idx] for row in values[1:] if len(row) > col_idx and row[col_idx]]
+
+
 def _colnum_to_a1(n: int) -> str:
     # 1 -> A, 27 -> AA
     s = ""
@@ -146,7 +210,7 @@ def write_to_sheets(
         raise ValueError("spreadsheet_key is required")
 
     # Inline small steps directly here instead of tiny helpers so flow is explicit
-    gc = pygsheets.authorize(service_account_file=SHEETS_AUTHENTICATION_FILE)
+    gc = _get_gs_client()
 
     # Open spreadsheet by key
     sheet = gc.open_by_key(spreadsheet_key)
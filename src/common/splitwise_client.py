@@ -7,6 +7,9 @@ including expense management, search, and data export.
 # Standard library
 import json
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import cache
 from pathlib import Path
@@ -21,12 +24,18 @@ from splitwise.user import ExpenseUser
 
 # Local application
 from src.common.env import load_project_env
+from src.constants.config import USER_ID_CACHE_PATH
 from src.common.transaction_filters import is_deleted_expense
 from src.common.utils import LOG, infer_category, parse_float_safe
 from src.constants.export_columns import ExportColumns
 from src.constants.splitwise import (
     DEFAULT_CURRENCY,
+    DEFAULT_LOOKBACK_DAYS,
     DELETED_AT_FIELD,
+    DETAIL_FETCH_MAX_WORKERS,
+    EXPENSE_CACHE_TTL_SECONDS,
+    EXPENSE_RANGE_CACHE_TTL_SECONDS,
+    PAGE_FETCH_BATCH_SIZE,
     DETAILS_COLUMN_NAME,
     REFUND_KEYWORDS,
     SPLIT_TYPE_PARTNER,
@@ -38,6 +47,23 @@ from src.constants.splitwise import (
 
 load_project_env()
 
+# Strips surrounding whitespace and quote layers in one pass (the Splitwise SDK
+# may wrap the details field in doubled quotes like ''value'')
+_QUOTE_STRIP_RE = re.compile(r"^[\s'\"]+|[\s'\"]+$")
+
+# Refund keywords fused into one alternation for the vectorized contains()
+# pass; escaped so the keywords stay literal substrings even if a future
+# entry contains a regex metacharacter
+_REFUND_KEYWORDS_RE = re.compile(
+    "|".join(map(re.escape, REFUND_KEYWORDS)), re.IGNORECASE
+)
+
+
+def _user_name(u) -> str:
+    """Display name for an expense user: first name, falling back to the ID."""
+    first = u.getFirstName() or ""
+    return first.strip() or str(u.getId())
+
 
 # Handles Splitwise API/CSV integration
 class SplitwiseClient:
@@ -53,6 +79,12 @@ class SplitwiseClient:
         self.sObj = Splitwise(
             self.consumer_key, self.consumer_secret, api_key=self.api_key
         )
+        # Short-TTL cache of built date-range frames, keyed by
+        # (start, end, lite); cleared whenever this client creates an expense
+        self._range_cache: Dict[tuple, tuple] = {}
+        # Set once the categories endpoint has failed, so _category_name
+        # stops retrying it per row and reads names off the expense objects
+        self._category_names_unavailable = False
 
     @cache
     def get_current_user(self):
@@ -65,12 +97,34 @@ class SplitwiseClient:
 
     @cache
     def get_current_user_id(self):
-        """Get current user ID from Splitwise API.
+        """Get current user ID, avoiding the API round-trip when possible.
+
+        The ID is stable per credential set, so resolution order is: the
+        SPLITWISE_USER_ID env var, then a small disk cache under data/, and
+        only then the Splitwise API (which also primes the disk cache).
 
         Returns:
             int: User ID
         """
-        return self.get_current_user().getId()
+        env_id = os.getenv("SPLITWISE_USER_ID")
+        if env_id:
+            try:
+                return int(env_id)
+            except ValueError:
+                LOG.warning(f"Ignoring non-numeric SPLITWISE_USER_ID: {env_id!r}")
+
+        try:
+            if USER_ID_CACHE_PATH.exists():
+                return int(USER_ID_CACHE_PATH.read_text().strip())
+        except (OSError, ValueError) as e:
+            LOG.debug(f"Ignoring unreadable user-id cache: {e}")
+
+        user_id = self.get_current_user().getId()
+        try:
+            USER_ID_CACHE_PATH.write_text(str(user_id))
+        except OSError as e:
+            LOG.debug(f"Could not write user-id cache: {e}")
+        return user_id
 
     def _fetch_expenses_paginated(
         self, start_date_str: str, end_date_str: str, fetch_full_details: bool = False
@@ -91,70 +145,108 @@ class SplitwiseClient:
             + (" with full details" if fetch_full_details else "")
         )
         all_expenses = []
-        offset = 0
         page_size = SPLITWISE_PAGE_SIZE
         has_more = True
 
-        # First, get the list of expense IDs
-        while has_more:
+        def _fetch_page(offset):
             try:
-                expenses = self.sObj.getExpenses(
+                return self.sObj.getExpenses(
                     dated_after=start_date_str,
                     dated_before=end_date_str,
                     limit=page_size,
                     offset=offset,
                 )
+            except Exception as e:
+                LOG.error(f"Error fetching expense list (offset {offset}): {str(e)}")
+                raise
 
-                if not expenses:
-                    break
+        # First, get the list of expense IDs. The API gives no total count, so
+        # fetch pages speculatively in small batches to overlap the round trips
+        # and stop after the first batch that contains a short (or empty) page.
+        # executor.map preserves offset order, so results stay deterministic.
+        batch_start = 0
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_BATCH_SIZE) as executor:
+            while has_more:
+                offsets = [
+                    batch_start + i * page_size for i in range(PAGE_FETCH_BATCH_SIZE)
+                ]
+                for expenses in executor.map(_fetch_page, offsets):
+                    if not expenses:
+                        has_more = False
+                        break
+
+                    # Filter out deleted expenses from the basic list
+                    non_deleted = [
+                        exp for exp in expenses if not is_deleted_expense(exp)
+                    ]
 
-                # Filter out deleted expenses from the basic list
-                non_deleted = [exp for exp in expenses if not is_deleted_expense(exp)]
+                    all_expenses.extend(non_deleted)
 
-                all_expenses.extend(non_deleted)
+                    if len(expenses) < page_size:
+                        has_more = False
+                        break
 
-                if len(expenses) < page_size:
-                    has_more = False
-                else:
-                    offset += page_size
-
-                LOG.debug(
-                    f"Fetched {len(expenses)} expenses (total: {len(all_expenses)})"
-                )
+                    LOG.debug(
+                        "Fetched %d expenses (total: %d)",
+                        len(expenses),
+                        len(all_expenses),
+                    )
 
-            except Exception as e:
-                LOG.error(f"Error fetching expense list (offset {offset}): {str(e)}")
-                raise
+                batch_start += PAGE_FETCH_BATCH_SIZE * page_size
 
         # If requested, fetch full details for each expense
         if fetch_full_details:
+            # The list endpoint already populates the details field for most
+            # rows; only expenses where it came back empty need the classic
+            # N+1 getExpense call.
+            missing_details = [exp for exp in all_expenses if not exp.getDetails()]
             LOG.info(
-                f"Fetched {len(all_expenses)} expenses, now getting full details for each"
+                f"Fetched {len(all_expenses)} expenses, "
+                f"{len(missing_details)} need a full detail fetch"
             )
-            detailed_expenses = []
-            for i, exp in enumerate(all_expenses):
+
+            def _fetch_detail(exp):
+                """Fetch full details for one expense (None if deleted)."""
+                expense_id = exp.getId()
                 try:
-                    expense_id = exp.getId()
                     # Fetch full expense details (includes the details field)
                     full_expense = self.sObj.getExpense(expense_id)
-
-                    # Skip deleted expenses
-                    if not (
-                        hasattr(full_expense, DELETED_AT_FIELD)
-                        and getattr(full_expense, DELETED_AT_FIELD)
-                    ):
-                        detailed_expenses.append(full_expense)
-
-                    if (i + 1) % 20 == 0:
-                        LOG.info(f"Processed {i + 1}/{len(all_expenses)} expenses")
-
                 except Exception as e:
                     LOG.warning(
                         f"Error fetching details for expense {expense_id}: {str(e)}"
                     )
                     # Keep the original expense without full details
-                    detailed_expenses.append(exp)
-                    continue
+                    return exp
+
+                # Skip deleted expenses
+                if hasattr(full_expense, DELETED_AT_FIELD) and getattr(
+                    full_expense, DELETED_AT_FIELD
+                ):
+                    return None
+                return full_expense
+
+            # The per-expense calls are pure I/O latency, so overlap them with a
+            # small thread pool; results are keyed by ID so original list order
+            # is preserved when stitching back together below.
+            detailed_by_id = {}
+            with ThreadPoolExecutor(max_workers=DETAIL_FETCH_MAX_WORKERS) as executor:
+                for i, full_expense in enumerate(
+                    executor.map(_fetch_detail, missing_details)
+                ):
+                    detailed_by_id[missing_details[i].getId()] = full_expense
+
+                    if (i + 1) % 20 == 0:
+                        LOG.info(
+                            f"Processed {i + 1}/{len(missing_details)} detail fetches"
+                        )
+
+            # Stitch: list-response object where details were present, fetched
+            # object where they weren't, and drop expenses found to be deleted
+            detailed_expenses = []
+            for exp in all_expenses:
+                full_expense = detailed_by_id.get(exp.getId(), exp)
+                if full_expense is not None:
+                    detailed_expenses.append(full_expense)
 
             all_expenses = detailed_expenses
 
@@ -182,7 +274,9 @@ class SplitwiseClient:
 
         This fetches the expense list first, then calls getExpense(id) for each
         one to populate the details field. Results are cached to disk and reused
-        on subsequent runs.
+        on subsequent runs; caches older than EXPENSE_CACHE_TTL_SECONDS are
+        refreshed from the API, falling back to the stale copy if the refresh
+        fails.
 
         Args:
             start_date_str: Start date as string (YYYY-MM-DD)
@@ -195,21 +289,38 @@ class SplitwiseClient:
         cache_path = self._get_expense_cache_path(start_date_str, end_date_str)
 
         # Try to load from disk cache first
+        cached_data = None
         if use_cache and cache_path.exists():
             try:
                 with open(cache_path, "r") as f:
                     cached_data = json.load(f)
-                LOG.info(
-                    f"Loaded {len(cached_data)} expenses from disk cache: {cache_path.name}"
-                )
-                return cached_data
             except Exception as e:
                 LOG.warning(f"Failed to load cache from {cache_path}: {e}")
 
-        # Fetch from API if cache miss or disabled
-        all_expenses = self._fetch_expenses_paginated(
-            start_date_str, end_date_str, fetch_full_details=True
-        )
+            if cached_data is not None:
+                cache_age = time.time() - cache_path.stat().st_mtime
+                if cache_age < EXPENSE_CACHE_TTL_SECONDS:
+                    LOG.info(
+                        f"Loaded {len(cached_data)} expenses from disk cache: {cache_path.name}"
+                    )
+                    return cached_data
+                LOG.info(
+                    f"Disk cache {cache_path.name} is stale ({cache_age / 3600:.1f}h old), refreshing"
+                )
+
+        # Fetch from API if cache miss, stale, or disabled
+        try:
+            all_expenses = self._fetch_expenses_paginated(
+                start_date_str, end_date_str, fetch_full_details=True
+            )
+        except Exception as e:
+            # Stale-while-revalidate fallback: a stale cache beats a hard failure
+            if cached_data is not None:
+                LOG.warning(
+                    f"API fetch failed ({e}); serving stale cache {cache_path.name}"
+                )
+                return cached_data
+            raise
 
         # Convert to dict format for duplicate detection
         expenses_with_details = {}
@@ -221,9 +332,7 @@ class SplitwiseClient:
                 "description": expense.getDescription(),
                 "cost": expense.getCost(),
                 "details": expense.getDetails() or "",
-                "category": (
-                    expense.getCategory().getName() if expense.getCategory() else None
-                ),
+                "category": self._category_name(expense),
             }
 
         # Save to disk cache
@@ -238,7 +347,7 @@ class SplitwiseClient:
 
         return expenses_with_details
 
-    def get_my_expenses_by_date_range(self, start_date, end_date):
+    def get_my_expenses_by_date_range(self, start_date, end_date, lite: bool = False):
         """Fetch all expenses within a date range with automatic pagination.
 
         This will page through the Splitwise API until no more results are
@@ -248,29 +357,69 @@ class SplitwiseClient:
         Args:
             start_date: Start date (datetime or date object)
             end_date: End date (datetime or date object)
+            lite: If True, skip building the display-only participant strings
+                (participant_names, friends_split). Useful for callers that only
+                need amount/date/description, e.g. reference-ID matching.
 
         Returns:
             DataFrame containing all matching expenses
         """
+        start_date_str = start_date.strftime("%Y-%m-%d")
+        end_date_str = end_date.strftime("%Y-%m-%d")
+
+        # Serve a recently built frame for the same range rather than re-paging
+        # the API; copies are handed out so callers can mutate freely.
+        cache_key = (start_date_str, end_date_str, lite)
+        cached = self._range_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_df = cached
+            if time.monotonic() - cached_at < EXPENSE_RANGE_CACHE_TTL_SECONDS:
+                LOG.debug(
+                    "Reusing cached expense range %s to %s (lite=%s)",
+                    start_date_str,
+                    end_date_str,
+                    lite,
+                )
+                return cached_df.copy()
+            del self._range_cache[cache_key]
+
         # Use the core pagination method (without full details for performance)
         all_expenses = self._fetch_expenses_paginated(
-            start_date.strftime("%Y-%m-%d"),
-            end_date.strftime("%Y-%m-%d"),
+            start_date_str,
+            end_date_str,
             fetch_full_details=False,
         )
 
         # Process the expenses into a DataFrame
         my_user_id = self.get_current_user_id()
-        data = []
+
+        # Hoisted out of the loop: the self-expense ID and the pre-hashed
+        # partner pair are invariant, so no per-row set construction is needed
+        self_expense_id = int(SplitwiseUserId.SELF_EXPENSE)
+        partner_pair = frozenset({my_user_id, int(SplitwiseUserId.PARTNER_EXPENSE)})
+
+        # Columnar accumulation: one list per output column (in export order) so
+        # the frame is built straight from typed arrays instead of per-row dicts
+        # that pandas has to transpose and dtype-sniff afterwards
+        cols = {
+            ExportColumns.DATE: [],
+            ExportColumns.AMOUNT: [],
+            ExportColumns.CATEGORY: [],
+            ExportColumns.DESCRIPTION: [],
+            ExportColumns.DETAILS: [],
+            ExportColumns.SPLIT_TYPE: [],
+            ExportColumns.PARTICIPANT_NAMES: [],
+            ExportColumns.MY_PAID: [],
+            ExportColumns.MY_OWED: [],
+            ExportColumns.MY_NET: [],
+            ExportColumns.FRIENDS_SPLIT: [],
+            ExportColumns.ID: [],
+        }
 
         for expense in all_expenses:
             try:
                 users = expense.getUsers() or []
 
-                def _user_name(u) -> str:
-                    first = u.getFirstName() or ""
-                    return first.strip() or str(u.getId())
-
                 user_rows = []
                 for u in users:
                     user_rows.append(
@@ -282,47 +431,17 @@ class SplitwiseClient:
                         }
                     )
 
-                user_rows_sorted = sorted(
-                    user_rows, key=lambda r: (r["name"] or "").lower()
-                )
-
-                # Sheets-friendly: single deterministic string, easy to parse with SPLIT/REGEX
-                # Example: "Alice|paid=10.00|owed=0.00; Bob|paid=0.00|owed=10.00"
-                friends_split = "; ".join(
-                    [
-                        f"{r['name']}|paid={r['paid']:.2f}|owed={r['owed']:.2f}"
-                        for r in user_rows_sorted
-                    ]
-                )
-
-                participant_names = ", ".join([r["name"] for r in user_rows_sorted])
-
-                my_row = next(
-                    (r for r in user_rows_sorted if r["id"] == my_user_id), None
-                )
+                # All the math below (my shares, participant ids, split type) is
+                # order-invariant, so work off the unsorted rows and defer the
+                # stable sort until the display strings are actually built.
+                my_row = next((r for r in user_rows if r["id"] == my_user_id), None)
                 my_paid = my_row["paid"] if my_row else 0.0
                 my_owed = my_row["owed"] if my_row else 0.0
 
-                # Check if this is a refund by description keywords
-                description = expense.getDescription() or ""
-                is_refund = any(
-                    keyword in description.lower() for keyword in REFUND_KEYWORDS
-                )
-
-                # For refunds, negate my_owed and my_paid to show as credits
-                if is_refund:
-                    my_owed = -my_owed
-                    my_paid = -my_paid
-
-                my_net = my_paid - my_owed
+                participant_ids = {r["id"] for r in user_rows}
 
-                participant_ids = {r["id"] for r in user_rows_sorted}
-
-                has_self_user = SplitwiseUserId.SELF_EXPENSE in participant_ids
-                is_partner_only = participant_ids == {
-                    my_user_id,
-                    SplitwiseUserId.PARTNER_EXPENSE,
-                }
+                has_self_user = self_expense_id in participant_ids
+                is_partner_only = participant_ids == partner_pair
 
                 if has_self_user:
                     split_type = SPLIT_TYPE_SELF
@@ -331,40 +450,113 @@ class SplitwiseClient:
                 else:
                     other_nonzero = any(
                         r["id"] != my_user_id and (r["paid"] > 0 or r["owed"] > 0)
-                        for r in user_rows_sorted
+                        for r in user_rows
                     )
                     split_type = (
                         SPLIT_TYPE_SPLIT if bool(other_nonzero) else SPLIT_TYPE_SELF
                     )
 
-                data.append(
-                    {
-                        ExportColumns.DATE: expense.getDate(),
-                        ExportColumns.AMOUNT: expense.getCost(),
-                        ExportColumns.CATEGORY: (
-                            expense.getCategory().getName()
-                            if expense.getCategory()
-                            else None
-                        ),
-                        ExportColumns.DESCRIPTION: expense.getDescription(),
-                        ExportColumns.DETAILS: expense.getDetails() or "",
-                        ExportColumns.SPLIT_TYPE: split_type,
-                        ExportColumns.PARTICIPANT_NAMES: participant_names,
-                        ExportColumns.MY_PAID: my_paid,
-                        ExportColumns.MY_OWED: my_owed,
-                        ExportColumns.MY_NET: my_net,
-                        ExportColumns.FRIENDS_SPLIT: friends_split,
-                        ExportColumns.ID: expense.getId(),
-                    }
-                )
+                if lite:
+                    friends_split = ""
+                    participant_names = ""
+                else:
+                    user_rows_sorted = sorted(
+                        user_rows, key=lambda r: (r["name"] or "").lower()
+                    )
+
+                    # Sheets-friendly: single deterministic string, easy to parse with SPLIT/REGEX
+                    # Example: "Alice|paid=10.00|owed=0.00; Bob|paid=0.00|owed=10.00"
+                    # Build both display strings in one pass over the sorted rows
+                    friends_parts = []
+                    participant_parts = []
+                    for r in user_rows_sorted:
+                        friends_parts.append(
+                            f"{r['name']}|paid={r['paid']:.2f}|owed={r['owed']:.2f}"
+                        )
+                        participant_parts.append(r["name"])
+
+                    friends_split = "; ".join(friends_parts)
+                    participant_names = ", ".join(participant_parts)
+
+                # Pull every accessor value before the first append so a raise
+                # can't leave the column lists ragged
+                date_val = expense.getDate()
+                amount_val = expense.getCost()
+                category_name = self._category_name(expense)
+                description_val = expense.getDescription()
+                details_val = expense.getDetails() or ""
+                expense_id = expense.getId()
+
+                cols[ExportColumns.DATE].append(date_val)
+                cols[ExportColumns.AMOUNT].append(amount_val)
+                cols[ExportColumns.CATEGORY].append(category_name)
+                cols[ExportColumns.DESCRIPTION].append(description_val)
+                cols[ExportColumns.DETAILS].append(details_val)
+                cols[ExportColumns.SPLIT_TYPE].append(split_type)
+                cols[ExportColumns.PARTICIPANT_NAMES].append(participant_names)
+                cols[ExportColumns.MY_PAID].append(my_paid)
+                cols[ExportColumns.MY_OWED].append(my_owed)
+                cols[ExportColumns.MY_NET].append(0.0)  # computed vectorially below
+                cols[ExportColumns.FRIENDS_SPLIT].append(friends_split)
+                cols[ExportColumns.ID].append(expense_id)
             except Exception as e:
                 LOG.warning(
                     f"Error processing expense {getattr(expense, 'id', 'unknown')}: {str(e)}"
                 )
                 continue
 
-        LOG.info(f"Found {len(data)} expenses between {start_date} and {end_date}")
-        return pd.DataFrame(data)
+        num_rows = len(cols[ExportColumns.ID])
+        LOG.info(f"Found {num_rows} expenses between {start_date} and {end_date}")
+
+        # Give the share columns an explicit float dtype so pandas skips
+        # inference and never upcasts them from object
+        for col in (ExportColumns.MY_PAID, ExportColumns.MY_OWED, ExportColumns.MY_NET):
+            cols[col] = np.asarray(cols[col], dtype=np.float64)
+
+        # Category stays an object column: it can hold None (no category on
+        # the expense), and a categorical with NaN breaks the sheet writer's
+        # fillna and turns None into float nan in to_dict("records") consumers
+        df = pd.DataFrame(cols) if num_rows else pd.DataFrame()
+
+        if not df.empty:
+            # Refund handling, vectorized: one contains() pass over the column
+            # instead of a per-row Python keyword scan. Refunds have my_paid and
+            # my_owed negated so they show as credits.
+            is_refund = (
+                df[ExportColumns.DESCRIPTION]
+                .fillna("")
+                .astype(str)
+                .str.contains(_REFUND_KEYWORDS_RE, regex=True)
+            )
+            df.loc[is_refund, [ExportColumns.MY_PAID, ExportColumns.MY_OWED]] *= -1
+            df[ExportColumns.MY_NET] = (
+                df[ExportColumns.MY_PAID] - df[ExportColumns.MY_OWED]
+            )
+
+        # For finder callers, precompute a canonical lowercase description once
+        # so repeated matching doesn't re-coerce the whole column per call.
+        # Kept out of the normal (export) path so the column never reaches Sheets.
+        if lite and not df.empty:
+            df["_description_lower"] = (
+                df[ExportColumns.DESCRIPTION].fillna("").astype(str).str.lower()
+            )
+            # Dates parsed once here so the fuzzy matcher compares directly
+            # instead of re-running pd.to_datetime per search
+            df["_expense_date"] = pd.to_datetime(
+                df[ExportColumns.DATE], errors="coerce"
+            ).dt.date
+            # Amounts as integer cents; monetary equality then needs no
+            # floating-point tolerance
+            df["_amount_cents"] = (
+                pd.to_numeric(df[ExportColumns.AMOUNT], errors="coerce")
+                .fillna(0.0)
+                .mul(100)
+                .round()
+                .astype(np.int64)
+            )
+
+        self._range_cache[cache_key] = (time.monotonic(), df.copy())
+        return df
 
     def get_expense_by_id(
         self,
@@ -405,7 +597,7 @@ class SplitwiseClient:
                     LOG.info(f"Found expense {expense_id} in disk cache")
                     return cached
             except Exception as e:
-                LOG.debug(f"Cache lookup failed for expense {expense_id}: {e}")
+                LOG.debug("Cache lookup failed for expense %s: %s", expense_id, e)
 
         # -------------------------
         # 2. Fallback to API
@@ -436,6 +628,29 @@ class SplitwiseClient:
         LOG.info(f"Fetched expense {expense_id} from API")
         return normalized
 
+    @cache
+    def _build_details_index(self, start_date: str, end_date: str) -> Dict[str, Dict]:
+        """Build a cleaned details -> expense index for a date range (cached).
+
+        One O(N) pass over the detail cache replaces a full scan per reference
+        lookup; repeat lookups in the same process hit the memoized dict.
+
+        Args:
+            start_date: Start date as string (YYYY-MM-DD)
+            end_date: End date as string (YYYY-MM-DD)
+
+        Returns:
+            dict: Mapping of cleaned details string -> expense dict
+        """
+        expense_cache = self.fetch_expenses_with_details(start_date, end_date)
+
+        details_index = {}
+        for exp_data in expense_cache.values():
+            details_clean = _QUOTE_STRIP_RE.sub("", str(exp_data.get("details", "")))
+            if details_clean:
+                details_index.setdefault(details_clean, exp_data)
+        return details_index
+
     def find_expense_by_cc_reference(
         self,
         cc_reference_id: str = None,
@@ -490,40 +705,56 @@ class SplitwiseClient:
                     start_date = "2025-01-01"
                     end_date = "2025-12-31"
 
-            # Call cached method with string dates
-            expense_cache = self.fetch_expenses_with_details(start_date, end_date)
-
-            # Search in the cache
-            cc_ref_clean = cc_reference_id.strip().strip("'\"")
-            for exp_id, exp_data in expense_cache.items():
-                details_clean = str(exp_data.get("details", "")).strip().strip("'\"")
-                if details_clean == cc_ref_clean:
-                    LOG.info(
-                        f"Found expense {exp_id} matching cc_reference_id: {cc_reference_id}"
-                    )
-                    return exp_data
+            # O(1) lookup against the memoized details index
+            cc_ref_clean = _QUOTE_STRIP_RE.sub("", cc_reference_id)
+            exp_data = self._build_details_index(start_date, end_date).get(cc_ref_clean)
+            if exp_data:
+                LOG.info(
+                    f"Found expense {exp_data['id']} matching cc_reference_id: {cc_reference_id}"
+                )
+                return exp_data
             return None
 
-        # Fallback: Fetch from API (legacy behavior, doesn't have details field)
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=lookback_days)
+        # Fallback: Fetch from API (legacy behavior, doesn't have details field).
+        # When the transaction date is known, shrink the fetch window to +/- 1
+        # day around it instead of downloading the entire lookback range.
+        window = None
+        if date:
+            try:
+                target_date = pd.to_datetime(date).date()
+                window = (
+                    target_date - timedelta(days=1),
+                    target_date + timedelta(days=1),
+                )
+            except Exception:
+                LOG.debug("Could not parse date '%s'; using lookback window", date)
+
+        if window is None:
+            end_date = datetime.now().date()
+            window = (
+                end_date - timedelta(days=lookback_days or DEFAULT_LOOKBACK_DAYS),
+                end_date,
+            )
 
-        df = self.get_my_expenses_by_date_range(start_date, end_date)
+        start_date, end_date = window
+
+        # Matching only needs details/amount/date/description, so skip building
+        # the participant display strings
+        df = self.get_my_expenses_by_date_range(start_date, end_date, lite=True)
         if df.empty:
             return None
 
         # First, try exact match by cc_reference_id in details if provided
         if cc_reference_id and DETAILS_COLUMN_NAME in df.columns:
-            # Strip quotes and whitespace from both sides for comparison
-            # (Splitwise SDK may wrap details in DOUBLE quotes like ''value'')
-            df_details_clean = df[DETAILS_COLUMN_NAME].astype(str).str.strip()
-            # Strip multiple layers of quotes (Splitwise returns ''value'' with double quotes)
-            for _ in range(3):
-                df_details_clean = df_details_clean.str.strip("'\"")
+            # Strip quotes and whitespace from both sides in a single compiled-regex
+            # pass instead of repeated str.strip allocations over the whole column
+            df_details_clean = (
+                df[DETAILS_COLUMN_NAME]
+                .astype(str)
+                .str.replace(_QUOTE_STRIP_RE, "", regex=True)
+            )
 
-            cc_ref_clean = str(cc_reference_id).strip()
-            for _ in range(3):
-                cc_ref_clean = cc_ref_clean.strip("'\"")
+            cc_ref_clean = _QUOTE_STRIP_RE.sub("", str(cc_reference_id))
 
             details_matches = df_details_clean == cc_ref_clean
             matches = df[details_matches]
@@ -541,7 +772,7 @@ class SplitwiseClient:
                     .to_dict()
                 )
             else:
-                LOG.debug(f"No exact details match found for '{cc_ref_clean}'")
+                LOG.debug("No exact details match found for '%s'", cc_ref_clean)
 
         # If we have amount and date, try fuzzy matching
         if amount is not None and date:
@@ -549,41 +780,35 @@ class SplitwiseClient:
                 # Convert date string to datetime for comparison
                 target_date = pd.to_datetime(date).date()
 
-                # Filter for same amount (within a small tolerance for floating point)
-                amount_matches = np.isclose(
-                    df["amount"].astype(float), float(amount), rtol=1e-5
-                )
-                df_filtered = df[amount_matches]
-
-                if not df_filtered.empty:
-                    # Filter for same date
-                    df_filtered["expense_date"] = pd.to_datetime(
-                        df_filtered["date"]
-                    ).dt.date
-                    date_matches = df_filtered["expense_date"] == target_date
-                    df_filtered = df_filtered[date_matches]
-
-                    if not df_filtered.empty:
-                        # If we have merchant info, try to match that too
-                        if merchant:
-                            merchant = str(merchant).lower().strip()
-                            if merchant:
-                                merchant_matches = (
-                                    df_filtered["description"]
-                                    .str.lower()
-                                    .str.contains(merchant, regex=False)
-                                )
-                                merchant_matches = df_filtered[merchant_matches]
-                                if not merchant_matches.empty:
-                                    df_filtered = merchant_matches
-
-                        # Return the best match (most recent if multiple)
-                        if not df_filtered.empty:
-                            best_match = df_filtered.sort_values(
-                                "date_updated", ascending=False
-                            ).iloc[0]
-                            LOG.info("Found potential match by amount/date/merchant")
-                            return best_match.to_dict()
+                # Compose boolean masks against the parent frame and slice once
+                # at the end, instead of materializing an intermediate copy of
+                # the DataFrame per filter step.
+                # Amount: single int64 equality on precomputed cents instead of
+                # the float cast + np.isclose temporaries
+                target_cents = int(round(float(amount) * 100))
+                mask = (df["_amount_cents"] == target_cents).to_numpy()
+                # Date: compare against the column parsed at build time.
+                # Composed out-of-place: under copy-on-write (pandas 3)
+                # .to_numpy() can hand back a read-only array, so an
+                # in-place &= would raise on every call
+                mask = mask & (df["_expense_date"] == target_date).to_numpy()
+
+                # Merchant is a hint: only narrow further if it still matches
+                if merchant:
+                    merchant = str(merchant).lower().strip()
+                    if merchant:
+                        merchant_mask = mask & (
+                            df["_description_lower"]
+                            .str.contains(merchant, regex=False)
+                            .to_numpy()
+                        )
+                        if merchant_mask.any():
+                            mask = merchant_mask
+
+                if mask.any():
+                    best_match = df.loc[mask].iloc[0]
+                    LOG.info("Found potential match by amount/date/merchant")
+                    return best_match.to_dict()
 
             except Exception as e:
                 LOG.warning("Error during fuzzy matching: %s", str(e), exc_info=True)
@@ -592,6 +817,44 @@ class SplitwiseClient:
         LOG.debug("No matching expense found")
         return None
 
+    def find_expenses_by_cc_references(
+        self,
+        cc_reference_ids: List[str],
+        start_date: str = None,
+        end_date: str = None,
+    ) -> Dict[str, Dict]:
+        """Find expenses for a batch of cc_reference_ids in a single pass.
+
+        Instead of re-scanning the expense cache once per reference ID, build a
+        cleaned details -> expense index once and resolve every ID against it,
+        so a batch of B IDs over N expenses costs O(N + B) instead of O(B * N).
+
+        Args:
+            cc_reference_ids: Credit card reference IDs to look up
+            start_date: Start date for search range (YYYY-MM-DD), defaults to 2025-01-01
+            end_date: End date for search range (YYYY-MM-DD), defaults to 2025-12-31
+
+        Returns:
+            dict: Mapping of cc_reference_id -> expense dict for the IDs found
+        """
+        refs = [
+            _QUOTE_STRIP_RE.sub("", str(ref))
+            for ref in cc_reference_ids
+            if ref and str(ref).strip()
+        ]
+        if not refs:
+            return {}
+
+        # Match find_expense_by_cc_reference's default search range
+        if not start_date or not end_date:
+            start_date = "2025-01-01"
+            end_date = "2025-12-31"
+
+        details_index = self._build_details_index(start_date, end_date)
+        found = {ref: details_index[ref] for ref in refs if ref in details_index}
+        LOG.info(f"Matched {len(found)}/{len(refs)} reference IDs in batch lookup")
+        return found
+
     def add_expense_from_txn(
         self,
         txn: Dict[str, Any],
@@ -750,6 +1013,8 @@ class SplitwiseClient:
                 raise RuntimeError("Failed to get expense ID from created expense")
 
             LOG.info(f"Successfully created expense with ID: {expense_id}")
+            # New expense invalidates any cached range frames that overlap it
+            self._range_cache.clear()
             return int(expense_id)
         except RuntimeError:
             raise
@@ -766,6 +1031,47 @@ class SplitwiseClient:
         """
         return self.sObj.getCategories()
 
+    @cache
+    def get_category_names(self) -> Dict[int, str]:
+        """Get a flat mapping of category/subcategory ID to name (cached).
+
+        Returns:
+            dict: Mapping of Splitwise category ID -> category name
+        """
+        names = {}
+        for category in self.get_categories():
+            names[category.getId()] = category.getName()
+            for subcategory in category.getSubcategories() or []:
+                names[subcategory.getId()] = subcategory.getName()
+        return names
+
+    def _category_name(self, expense) -> Optional[str]:
+        """Resolve an expense's category name via the cached ID -> name map.
+
+        Avoids re-walking the nested Category object chain per row in the hot
+        loops; falls back to the object's own name for unknown IDs.
+        """
+        category = expense.getCategory()
+        if category is None:
+            return None
+        if not self._category_names_unavailable:
+            try:
+                name = self.get_category_names().get(category.getId())
+            except Exception as e:
+                # A getCategories failure must not discard an expense fetch
+                # that already succeeded; fall back to the name embedded on
+                # the expense (the pre-map behavior). @cache doesn't memoize
+                # raises, so remember the failure instead of retrying per row.
+                LOG.warning(
+                    f"Failed to load category name map ({e}); "
+                    "using embedded category names"
+                )
+                self._category_names_unavailable = True
+            else:
+                if name is not None:
+                    return name
+        return category.getName()
+
 
 def get_splitwise_client(dry_run: bool = False) -> Optional["SplitwiseClient"]:
     """Get SplitwiseClient instance (None in dry-run mode).
@@ -9,7 +9,7 @@ import yaml
 import hashlib
 import re
 import tempfile
-from functools import cache
+from functools import cache, lru_cache
 from typing import Union, Optional, Dict, Any
 
 from src.constants.config import CFG_PATHS
@@ -19,10 +19,14 @@ from src.common.env import load_project_env
 load_project_env()
 
 LOG = logging.getLogger("cc_splitwise")
-handler = logging.StreamHandler()
-formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
-handler.setFormatter(formatter)
-LOG.addHandler(handler)
+# getLogger returns the same logger object process-wide, so only install a
+# handler if none is attached yet — re-running this module body (e.g. when
+# imported under two names) must not stack handlers and double every line
+if not LOG.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+    handler.setFormatter(formatter)
+    LOG.addHandler(handler)
 LOG.setLevel(os.getenv("LOG_LEVEL", "INFO"))
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -43,6 +47,11 @@ def parse_date_string(date_str: str) -> date:
     Raises:
         ValueError: If date_str is not in valid format
     """
+    return _parse_date_string_cached(date_str)
+
+
+@lru_cache(maxsize=256)
+def _parse_date_string_cached(date_str: str) -> date:
     return datetime.strptime(date_str, DATE_FORMAT).date()
 
 
@@ -60,11 +69,22 @@ def format_date(date_obj: Union[date, datetime]) -> str:
     return date_obj.strftime(DATE_FORMAT)
 
 
-def load_yaml(path):
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime: float):
     with open(path, "r") as f:
         return yaml.safe_load(f)
 
 
+def load_yaml(path):
+    """Load a YAML file, cached until the file's mtime changes.
+
+    Keying the cache on (path, mtime) means repeat loads of an unchanged
+    config are a dict hit, while editing the file on disk naturally
+    invalidates the entry on the next call.
+    """
+    return _load_yaml_cached(str(path), os.path.getmtime(path))
+
+
 def clean_description_for_splitwise(
     description: str, config: Optional[Dict] = None
 ) -> str:
@@ -266,6 +286,38 @@ def clean_description_for_splitwise(
     return cleaned
 
 
+# Compiled once at import: these run per merchant in the slug/cleaning hot
+# paths, so the per-call re-module cache lookup is skipped entirely
+_MERCHANT_PREFIX_RES = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"^SP\s+",  # Square point of sale prefix
+        r"^GglPay\s+",  # Google Pay prefix
+        r"^PayPal\s*\*\s*",  # PayPal prefix
+        r"^SQ\s*\*\s*",  # Square prefix
+    )
+]
+_MULTISPACE_SPLIT_RE = re.compile(r"\s{2,}")
+_PHONE_SUFFIX_RE = re.compile(r"\s*\(?\d{3}\)?\s*\d{3}-\d{4}\s*$")
+_STATE_SUFFIX_RE = re.compile(r"\s+[A-Z]{2}$")
+
+_SLUG_SUFFIX_RE = re.compile(r"\b(inc|llc|ltd|co|corp|company|the)\b")
+_SLUG_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_DASHES_RE = re.compile(r"-+")
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a config-supplied pattern once, case-insensitively.
+
+    The category config can hold dozens of patterns that are re-checked for
+    every transaction; caching the compiled objects keeps the per-transaction
+    cost to the searches themselves. re.error propagates to the caller, which
+    already handles invalid config patterns.
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def clean_merchant_name(description: str, config: Optional[Dict] = None) -> str:
     """Clean up and standardize merchant names from transaction descriptions.
 
@@ -289,26 +341,27 @@ def clean_merchant_name(description: str, config: Optional[Dict] = None) -> str:
     """
     if not description or not isinstance(description, str):
         return description or ""
+    # Memoized core: the same merchant strings recur across a statement, so
+    # each distinct description pays the regex passes once. config is unused
+    # in the simplified version, so it doesn't key the cache.
+    return _clean_merchant_name_cached(description)
+
 
+@lru_cache(maxsize=8192)
+def _clean_merchant_name_cached(description: str) -> str:
     # Remove prefixes that aren't part of merchant name
     description = description.strip()
 
-    # Remove common payment processor prefixes
-    prefixes_to_remove = [
-        r"^SP\s+",  # Square point of sale prefix
-        r"^GglPay\s+",  # Google Pay prefix
-        r"^PayPal\s*\*\s*",  # PayPal prefix
-        r"^SQ\s*\*\s*",  # Square prefix
-    ]
-
-    for prefix_pattern in prefixes_to_remove:
-        description = re.sub(prefix_pattern, "", description, flags=re.IGNORECASE)
+    # Remove common payment processor prefixes (applied in order, so stacked
+    # prefixes fall off one by one as before)
+    for prefix_re in _MERCHANT_PREFIX_RES:
+        description = prefix_re.sub("", description)
 
     description = description.strip()
 
     # Split on multiple spaces (typically separates merchant from location/phone)
     # The pattern "  " (2+ spaces) typically separates sections
-    parts = re.split(r"\s{2,}", description)
+    parts = _MULTISPACE_SPLIT_RE.split(description)
 
     if not parts:
         return description
@@ -317,10 +370,10 @@ def clean_merchant_name(description: str, config: Optional[Dict] = None) -> str:
     merchant_name = parts[0].strip()
 
     # Remove phone numbers in format (XXX)XXX-XXXX or XXX-XXX-XXXX at the end
-    merchant_name = re.sub(r"\s*\(?\d{3}\)?\s*\d{3}-\d{4}\s*$", "", merchant_name)
+    merchant_name = _PHONE_SUFFIX_RE.sub("", merchant_name)
 
     # Remove state codes at the end (like "CA", "TX", "NY" etc)
-    merchant_name = re.sub(r"\s+[A-Z]{2}$", "", merchant_name)
+    merchant_name = _STATE_SUFFIX_RE.sub("", merchant_name)
 
     # Title case the result for readability
     merchant_name = " ".join(word.title() for word in merchant_name.split())
@@ -364,24 +417,31 @@ def save_state_atomic(path, obj):
         raise
 
 
+@lru_cache(maxsize=4096)
 def merchant_slug(s: str) -> str:
-    """Create a compact slug from merchant/description text."""
+    """Create a compact slug from merchant/description text.
+
+    Memoized: merchants repeat heavily across transactions, so the regex
+    passes run once per distinct input instead of once per row.
+    """
     if not s:
         return ""
     s = str(s).lower()
     # remove common company suffixes
-    s = re.sub(r"\b(inc|llc|ltd|co|corp|company|the)\b", "", s)
+    s = _SLUG_SUFFIX_RE.sub("", s)
     # keep alnum and replace others with hyphens
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    s = _SLUG_NONALNUM_RE.sub("-", s)
+    s = _SLUG_DASHES_RE.sub("-", s).strip("-")
     return s
 
 
+@lru_cache(maxsize=65536)
 def compute_import_id(date: str, amount: float, merchant: str) -> str:
     """Deterministic import id for a transaction.
 
     Uses date (ISO), amount in cents (rounded), and normalized merchant slug.
-    Returns a sha256 hex digest.
+    Returns a sha256 hex digest. Memoized: split expenses repeat the same
+    (date, amount, merchant) triple, so each distinct one is hashed once.
     """
     cents = int(round(float(amount) * 100))
     key = f"{date}|{cents}|{merchant_slug(merchant)}"
@@ -389,6 +449,31 @@ def compute_import_id(date: str, amount: float, merchant: str) -> str:
     return h
 
 
+# Explicit formats tried before falling back to dateparser. These cover the
+# date shapes bank CSVs actually produce and parse identically to
+# dateparser's en-US defaults for those shapes.
+_FAST_DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%Y/%m/%d", "%d-%b-%Y")
+
+
+def _parse_date_fast(s: str) -> Optional[datetime]:
+    """Parse common unambiguous date shapes without dateparser.
+
+    dateparser's locale-aware machinery costs hundreds of microseconds per
+    call; fromisoformat and a short strptime ladder handle the typical inputs
+    at a fraction of that. Returns None if no fast format matches.
+    """
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
+    for fmt in _FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+    return None
+
+
 def parse_date_safe(s):
     """Safely parse a date string into ISO format (YYYY-MM-DD).
 
@@ -402,14 +487,20 @@ def parse_date_safe(s):
         return None
 
     s = str(s).strip()
-    current_year = datetime.now().year
+
+    # Fast ladder first; only unusual formats fall through to dateparser
+    dt = _parse_date_fast(s)
+    if dt is not None:
+        return dt.date().isoformat()
 
     # Try parsing the date as-is first
     dt = dateparser.parse(s)
     if dt is not None:
         return dt.date().isoformat()
 
-    # If first attempt fails, try appending current year
+    # If first attempt fails, try appending current year (computed only on
+    # this rare retry path, not per call)
+    current_year = datetime.now().year
     dt = dateparser.parse(f"{s} {current_year}")
     if dt is not None:
         return dt.date().isoformat()
@@ -417,6 +508,30 @@ def parse_date_safe(s):
     return None
 
 
+def parse_date_series(s: pd.Series) -> pd.Series:
+    """Vectorized companion to parse_date_safe for whole DataFrame columns.
+
+    Parses the column in one pd.to_datetime pass (with value caching, since
+    statement dates repeat heavily) and routes only the rows that pass
+    rejects through parse_date_safe's full ladder, so dateparser runs for
+    the rare odd value instead of once per row. Same contract as mapping
+    parse_date_safe over the column: ISO date strings, missing where
+    unparseable.
+
+    Args:
+        s: Column of date strings in any parseable format
+
+    Returns:
+        Series of YYYY-MM-DD strings aligned to the input index
+    """
+    dates = pd.to_datetime(s, errors="coerce", cache=True)
+    out = dates.dt.strftime("%Y-%m-%d")
+    misses = dates.isna() & s.notna()
+    if misses.any():
+        out[misses] = s[misses].map(parse_date_safe)
+    return out
+
+
 def parse_date(s: str) -> date:
     """Parse a date string and return a datetime.date.
 
@@ -426,13 +541,27 @@ def parse_date(s: str) -> date:
     """
     if s is None:
         raise ValueError("No date string provided")
-    parsed = dateparser.parse(str(s))
+    s = str(s)
+    # Fast path: plain YYYY-MM-DD input (the common case for CLI args and
+    # env vars) skips dateparser's locale/regex machinery entirely
+    try:
+        return date.fromisoformat(s.strip())
+    except ValueError:
+        pass
+    parsed = dateparser.parse(s)
     if not parsed:
         raise ValueError(f"Could not parse date: {s}")
     return parsed.date()
 
 
 def parse_float_safe(v) -> float:
+    # Exact-type checks first: values coming out of pandas columns or the
+    # SDK are usually already float (or int), so skip the float() dispatch
+    # and the try frame for them
+    if type(v) is float:
+        return v
+    if type(v) is int:
+        return float(v)
     try:
         return float(v)
     except (ValueError, TypeError):
@@ -453,8 +582,14 @@ def generate_fingerprint(
         A stable fingerprint string for the transaction
     """
     try:
-        # Parse and normalize date
-        date_obj = dateparser.parse(str(date_val))
+        # Parse and normalize date. ISO inputs (what the API, database, and
+        # exports produce) skip dateparser entirely; fromisoformat yields the
+        # same date for them, so fingerprints are unchanged.
+        date_raw = str(date_val)
+        try:
+            date_obj = datetime.fromisoformat(date_raw.strip())
+        except ValueError:
+            date_obj = dateparser.parse(date_raw)
         date_str = date_obj.strftime("%Y-%m-%d") if date_obj else "unknown_date"
 
         # Normalize amount to 2 decimal places as string
@@ -478,6 +613,39 @@ def generate_fingerprint(
         ).hexdigest()
 
 
+def generate_fingerprints(
+    date_col: pd.Series, amount_col: pd.Series, desc_col: pd.Series
+) -> pd.Series:
+    """Vectorized companion to generate_fingerprint for whole DataFrame columns.
+
+    Normalizes the three fields with pandas column operations (one datetime
+    parse and one numeric coercion for the entire frame, instead of a
+    dateparser call per row) and hashes each normalized key. Produces the same
+    fingerprints as calling generate_fingerprint row by row for the
+    ISO-formatted dates the Splitwise API and database return.
+
+    Args:
+        date_col: Date column (any pandas-parseable format)
+        amount_col: Amount column (string or numeric)
+        desc_col: Description column
+
+    Returns:
+        Series of fingerprint strings aligned to the input index
+    """
+    dates = pd.to_datetime(date_col, errors="coerce")
+    date_strs = dates.dt.strftime("%Y-%m-%d").where(dates.notna(), "unknown_date")
+
+    amounts = pd.to_numeric(amount_col, errors="coerce")
+    amount_strs = amounts.map("{:.2f}".format).where(
+        amounts.notna(), amount_col.astype(str).str.strip()
+    )
+
+    descs = desc_col.fillna("").astype(str).str.strip()
+
+    keys = date_strs + "|" + amount_strs + "|" + descs
+    return keys.map(lambda k: hashlib.sha256(k.encode("utf-8")).hexdigest())
+
+
 @cache
 def _load_amex_category_mapping() -> Dict:
     """Load and cache the Amex category to Splitwise category mapping.
@@ -747,8 +915,9 @@ def infer_category(transaction: Dict[str, Any]) -> Dict[str, Any]:
         for subcategory in category.get("subcategories", []):
             for pattern in subcategory.get("patterns", []):
                 try:
-                    # Compile pattern with case-insensitive flag
-                    regex = re.compile(pattern, re.IGNORECASE)
+                    # Compiled once per distinct pattern (case-insensitive),
+                    # then reused across every transaction
+                    regex = _compile_pattern(pattern)
                     desc_match = bool(description and regex.search(description))
                     merchant_match = bool(merchant and regex.search(merchant.lower()))
 
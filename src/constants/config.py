@@ -29,6 +29,17 @@ PROCESSED_DIR = DATA_DIR / "processed"
 # State files
 STATE_PATH = DATA_DIR / "splitwise_exported.json"
 
+# Append-only delta log for exported state; folded back into STATE_PATH
+# whenever the full state is rewritten (compaction)
+STATE_DELTA_PATH = DATA_DIR / "splitwise_exported.jsonl"
+
+# Cached Splitwise user ID (saves one API round-trip per process start)
+USER_ID_CACHE_PATH = DATA_DIR / "splitwise_user_id"
+
+# Marker file touched whenever sheet fingerprints are merged into local
+# state; its mtime gates the (slow) remote fingerprint re-read
+SHEET_FP_SYNC_MARKER_PATH = DATA_DIR / "sheet_fps_synced"
+
 # Ensure directories exist
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(PROCESSED_DIR, exist_ok=True)
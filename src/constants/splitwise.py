@@ -22,6 +22,21 @@ DEFAULT_LOOKBACK_DAYS = (
     30  # Default number of days to look back for duplicate detection
 )
 
+# Number of concurrent getExpense calls when fetching full expense details.
+# Kept modest to stay well within Splitwise API rate limits.
+DETAIL_FETCH_MAX_WORKERS = 8
+
+# Number of expense-list pages fetched speculatively per batch during pagination
+PAGE_FETCH_BATCH_SIZE = 4
+
+# Disk-cached expense details older than this are refreshed from the API
+# (the stale copy is still served if the refresh fails)
+EXPENSE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# How long an in-memory date-range fetch stays fresh; long enough to cover a
+# batch import, short enough to notice edits made in the Splitwise app
+EXPENSE_RANGE_CACHE_TTL_SECONDS = 600
+
 # Column name for transaction details/notes field in exported data
 DETAILS_COLUMN_NAME = "Details"
 
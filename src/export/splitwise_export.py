@@ -11,11 +11,14 @@ Key features:
 - Overwrite mode for full refresh
 - Year-specific filtering
 """
+
 # Standard library
 import argparse
 import json
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from typing import List, Optional, Union
 
@@ -24,19 +27,23 @@ import pandas as pd
 
 # Local application
 from src.common.env import load_project_env, get_env
-from src.constants.config import STATE_PATH
+from src.constants.config import (
+    SHEET_FP_SYNC_MARKER_PATH,
+    STATE_DELTA_PATH,
+    STATE_PATH,
+)
 from src.constants.gsheets import DEFAULT_WORKSHEET_NAME
 
 # Load environment variables
 load_project_env()
 
-from src.common.sheets_sync import write_to_sheets, read_from_sheets
+from src.common.sheets_sync import write_to_sheets, read_column_from_sheets
 from src.common.splitwise_client import SplitwiseClient
 from src.common.utils import (
     load_state,
     save_state_atomic,
     LOG,
-    generate_fingerprint,
+    generate_fingerprints,
     parse_date,
 )
 from src.constants.splitwise import (
@@ -56,6 +63,10 @@ def get_current_user_name() -> str:
     return current_user.getFirstName() if current_user else ""
 
 
+# Precompiled once: word-boundary match for payment/settlement descriptions,
+# reused by both the database and API filter paths
+_PAYMENT_WORD_RE = re.compile(r"\bpayment\b", re.IGNORECASE)
+
 # Data source constants
 SOURCE_SPLITWISE = "splitwise"
 SOURCE_DATABASE = "database"
@@ -101,23 +112,78 @@ MSG_PROCESSED_SUCCESS = "Successfully processed {count} expenses"
 MSG_NO_EXPENSES_PROCESSED = "No expenses found or processed"
 
 
+# Delta log lines before the state is folded back into the base JSON file
+_STATE_COMPACT_MAX_LINES = 256
+
+# How long a sheet-fingerprint merge stays fresh before the remote read runs again
+_SHEET_FP_SYNC_TTL_SECONDS = 3600
+
+
+def _sheet_fps_fresh() -> bool:
+    """True if sheet fingerprints were merged into local state recently.
+
+    The worksheet only gains expense rows through this exporter, so once
+    its fingerprints have been folded into the state a re-read within the
+    TTL can't discover anything new.
+    """
+    if not STATE_PATH.exists():
+        return False
+    try:
+        age = time.time() - SHEET_FP_SYNC_MARKER_PATH.stat().st_mtime
+    except OSError:
+        return False
+    return age < _SHEET_FP_SYNC_TTL_SECONDS
+
+
+def _mark_sheet_fps_synced() -> None:
+    """Record that the sheet's fingerprints are reflected in local state."""
+    try:
+        SHEET_FP_SYNC_MARKER_PATH.touch()
+    except OSError as e:
+        LOG.debug("Could not touch sheet-sync marker: %s", e)
+
+
 def load_exported_state() -> tuple[set, set]:
     """Load the set of previously exported Splitwise expense IDs and fingerprints.
 
+    Reads the compacted base state, then folds in any append-only deltas
+    written since the last full rewrite.
+
     Returns:
         A tuple of (exported_ids, exported_fingerprints) as sets
     """
     try:
         state = load_state(STATE_PATH)
-        return set(state.get("exported_ids", [])), set(
-            state.get("exported_fingerprints", [])
-        )
+        exported_ids = set(state.get("exported_ids", []))
+        exported_fps = set(state.get("exported_fingerprints", []))
     except (FileNotFoundError, json.JSONDecodeError):
-        return set(), set()
+        exported_ids, exported_fps = set(), set()
+
+    try:
+        with open(STATE_DELTA_PATH, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    LOG.warning("Skipping corrupt state delta line: %.80s", line)
+                    continue
+                exported_ids.update(record.get("ids", []))
+                exported_fps.update(record.get("fps", []))
+    except FileNotFoundError:
+        pass
+
+    return exported_ids, exported_fps
 
 
 def save_exported_state(exported_ids: set, exported_fps: set) -> None:
-    """Save the set of exported Splitwise expense IDs and fingerprints.
+    """Save the full set of exported IDs and fingerprints (compaction).
+
+    Rewrites the base state file and clears the delta log, so this is
+    O(all rows); incremental updates should go through
+    append_exported_state instead.
 
     Args:
         exported_ids: Set of exported expense IDs
@@ -129,6 +195,40 @@ def save_exported_state(exported_ids: set, exported_fps: set) -> None:
         "last_updated": datetime.now().isoformat(),
     }
     save_state_atomic(STATE_PATH, state)
+    STATE_DELTA_PATH.unlink(missing_ok=True)
+
+
+def append_exported_state(new_ids: set, new_fps: set) -> None:
+    """Append newly exported IDs/fingerprints to the state delta log.
+
+    Writes only the delta (O(new rows)) instead of rewriting the whole
+    state file on every export. Once the log grows past
+    _STATE_COMPACT_MAX_LINES batches, it is compacted back into the base
+    JSON file.
+
+    Args:
+        new_ids: Expense IDs exported in this batch
+        new_fps: Fingerprints exported in this batch
+    """
+    if not new_ids and not new_fps:
+        return
+
+    record = {
+        "ids": sorted(new_ids),
+        "fps": sorted(new_fps),
+        "ts": datetime.now().isoformat(),
+    }
+    with open(STATE_DELTA_PATH, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+    try:
+        with open(STATE_DELTA_PATH, "r") as f:
+            num_lines = sum(1 for _ in f)
+    except OSError:
+        return
+    if num_lines > _STATE_COMPACT_MAX_LINES:
+        LOG.info("Compacting exported state (%d delta batches)", num_lines)
+        save_exported_state(*load_exported_state())
 
 
 def _read_existing_fingerprints(
@@ -147,12 +247,8 @@ def _read_existing_fingerprints(
     if not sheet_key or not worksheet_name:
         return None
 
-    df = read_from_sheets(sheet_key, worksheet_name, numerize=False)
-    if df is None or ExportColumns.FINGERPRINT not in df.columns:
-        return None
-
-    # Return non-empty fingerprints
-    return [fp for fp in df[ExportColumns.FINGERPRINT].dropna() if fp]
+    # Raw single-column fetch: no DataFrame round-trip for data we discard
+    return read_column_from_sheets(sheet_key, worksheet_name, ExportColumns.FINGERPRINT)
 
 
 def export_categories(sheet_key: str = None) -> Optional[str]:
@@ -358,13 +454,10 @@ def fetch_from_database(
                 df[col] = pd.to_numeric(df[col], errors="coerce")
 
         # Generate fingerprints for consistency with Splitwise source
-        df[ExportColumns.FINGERPRINT] = df.apply(
-            lambda r: generate_fingerprint(
-                r.get(ExportColumns.DATE),
-                r.get(ExportColumns.AMOUNT),
-                r.get(ExportColumns.DESCRIPTION, ""),
-            ),
-            axis=1,
+        df[ExportColumns.FINGERPRINT] = generate_fingerprints(
+            df[ExportColumns.DATE],
+            df[ExportColumns.AMOUNT],
+            df[ExportColumns.DESCRIPTION],
         )
 
         # Filter out payment/settlement transactions (same as Splitwise API filtering)
@@ -387,9 +480,7 @@ def fetch_from_database(
             payment_exact = desc_series.str.lower().eq(
                 ExcludedSplitwiseDescriptions.PAYMENT.value.lower()
             )
-            payment_word = desc_series.str.contains(
-                r"\bpayment\b", case=False, na=False
-            )
+            payment_word = desc_series.str.contains(_PAYMENT_WORD_RE, na=False)
 
             if ExportColumns.CATEGORY in df.columns:
                 category_general = (
@@ -474,7 +565,22 @@ def fetch_and_write(
         # Original Splitwise API behavior
         LOG.info(LOG_FETCHING_FROM_API)
         client = SplitwiseClient()
-        df = client.get_my_expenses_by_date_range(start_date, end_date)
+
+        # The Splitwise fetch and the sheet fingerprint read are independent
+        # I/Os, so overlap them: wall time becomes max() of the two latencies
+        # rather than their sum
+        prefetch_sheet_fps = append and sheet_key and not _sheet_fps_fresh()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            df_future = executor.submit(
+                client.get_my_expenses_by_date_range, start_date, end_date
+            )
+            fps_future = (
+                executor.submit(_read_existing_fingerprints, sheet_key, worksheet_name)
+                if prefetch_sheet_fps
+                else None
+            )
+            df = df_future.result()
+            sheet_existing_fps = fps_future.result() if fps_future else None
 
         # Filter out Splitwise-generated "Settle all balances" rows which are not useful for budgeting.
         # Match the exact phrase (case-insensitive, trimmed) instead of a fuzzy regex.
@@ -491,7 +597,7 @@ def fetch_and_write(
             num_settle = int(settle_mask.sum())
             if num_settle > 0:
                 LOG.info(LOG_FILTERED_SETTLE, num_settle)
-                df = df[~settle_mask].reset_index(drop=True)
+                df = df[~settle_mask]
 
             # Also filter out explicit 'Payment' rows (these are payments/settlements, not expenses).
             # Only target the description field; if a `category` column exists require it to be 'General'
@@ -500,9 +606,7 @@ def fetch_and_write(
             payment_exact = desc_series.str.lower().eq(
                 ExcludedSplitwiseDescriptions.PAYMENT.value.lower()
             )
-            payment_word = desc_series.str.contains(
-                r"\bpayment\b", case=False, na=False
-            )
+            payment_word = desc_series.str.contains(_PAYMENT_WORD_RE, na=False)
 
             if ExportColumns.CATEGORY in df.columns:
                 category_general = (
@@ -515,7 +619,7 @@ def fetch_and_write(
             num_pay = int(payment_mask.sum())
             if num_pay > 0:
                 LOG.info(LOG_FILTERED_PAYMENT, num_pay)
-                df = df[~payment_mask].reset_index(drop=True)
+                df = df[~payment_mask]
 
         if df is None or df.empty:
             LOG.info(LOG_NO_EXPENSES_FOUND, start_date, end_date)
@@ -523,20 +627,9 @@ def fetch_and_write(
 
         is_overwrite = not append
 
-        # Ensure all columns are strings for consistency
-        df = df.copy()
-        for col in df.columns:
-            df[col] = df[col].astype(str)
-
-        # Generate fingerprints using the utility function
-        df[ExportColumns.FINGERPRINT] = df.apply(
-            lambda r: generate_fingerprint(
-                r.get(ExportColumns.DATE),
-                r.get(ExportColumns.AMOUNT),
-                r.get(ExportColumns.DESCRIPTION, ""),
-            ),
-            axis=1,
-        )
+        # Keep native dtypes; only the ID needs string form so it compares
+        # equal against the persisted state file, which stores IDs as strings
+        df[ExportColumns.ID] = df[ExportColumns.ID].astype(str)
 
         # In overwrite mode, we want a full refresh of the worksheet.
         # That means we should not filter anything out based on prior exported state.
@@ -545,25 +638,52 @@ def fetch_and_write(
         else:
             # Always load existing exported state when not overwriting
             exported_ids, exported_fps = load_exported_state()
-            # If appending to a live sheet, also read existing fingerprints from that worksheet to handle
-            # cases where the local state file is missing or inconsistent.
-            if sheet_key:
-                sheet_existing_fps = _read_existing_fingerprints(
-                    sheet_key, worksheet_name
-                )
+            # If appending to a live sheet, also fold in the fingerprints read
+            # (concurrently, above) from that worksheet to handle cases where
+            # the local state file is missing or inconsistent. The read is
+            # skipped while a recent merge is still fresh: the round-trip plus
+            # full-sheet scan can't surface fingerprints we don't already have.
+            # Only a successful read (None means failure or missing worksheet)
+            # counts as a merge; marking after a failed read would suppress
+            # the consistency re-read for the whole TTL window
+            if prefetch_sheet_fps and sheet_existing_fps is not None:
+                _mark_sheet_fps_synced()
                 if sheet_existing_fps:
-                    exported_fps = set(exported_fps) | set(sheet_existing_fps)
-                    # Persist the discovered fingerprints so future runs don't recompute them each time
-                    save_exported_state(exported_ids, exported_fps)
-
-        # Filter new rows: not in exported ids and not in exported fingerprints
+                    discovered_fps = set(sheet_existing_fps) - exported_fps
+                    if discovered_fps:
+                        exported_fps |= discovered_fps
+                        # Persist just the discovered fingerprints so future runs
+                        # don't recompute them each time
+                        append_exported_state(set(), discovered_fps)
+
+        # Filter new rows: not in exported ids and not in exported fingerprints.
+        # Hash the (potentially large) state sets into Index tables once and
+        # probe them, instead of letting isin() rehash the sets per call.
+        # The cheap ID screen runs first so fingerprints (the expensive step,
+        # one sha256 per row) are only computed for rows that might be new.
         if not is_overwrite:
-            mask_new = ~(
-                (df[ExportColumns.ID].isin(exported_ids))
-                | (df[ExportColumns.FINGERPRINT].isin(exported_fps))
+            idx_ids = pd.Index(list(exported_ids))
+            # reset_index doubles as the detach-copy that makes the fingerprint
+            # assignment below warning-free
+            candidates = df[
+                idx_ids.get_indexer(df[ExportColumns.ID]) == -1
+            ].reset_index(drop=True)
+
+            candidates[ExportColumns.FINGERPRINT] = generate_fingerprints(
+                candidates[ExportColumns.DATE],
+                candidates[ExportColumns.AMOUNT],
+                candidates[ExportColumns.DESCRIPTION],
             )
-            new_df = df[mask_new].reset_index(drop=True)
+            idx_fps = pd.Index(list(exported_fps))
+            new_df = candidates[
+                idx_fps.get_indexer(candidates[ExportColumns.FINGERPRINT]) == -1
+            ].reset_index(drop=True)
         else:
+            df[ExportColumns.FINGERPRINT] = generate_fingerprints(
+                df[ExportColumns.DATE],
+                df[ExportColumns.AMOUNT],
+                df[ExportColumns.DESCRIPTION],
+            )
             new_df = df
 
         # Convert my_paid/my_owed to numeric and filter out expenses where the
@@ -647,15 +767,19 @@ def fetch_and_write(
         # Update exported state for Splitwise source
         is_overwrite = not append
         if is_overwrite:
-            updated_ids = set(new_df[ExportColumns.ID].tolist())
-            updated_fps = set(new_df[ExportColumns.FINGERPRINT].tolist())
+            # Full refresh: the sheet now holds exactly these rows, so rewrite
+            # the base state (which also clears the delta log)
+            save_exported_state(
+                set(new_df[ExportColumns.ID].tolist()),
+                set(new_df[ExportColumns.FINGERPRINT].tolist()),
+            )
         else:
-            exported_ids, exported_fps = load_exported_state()
-            updated_ids = set(exported_ids) | set(new_df[ExportColumns.ID].tolist())
-            updated_fps = set(exported_fps) | set(
-                new_df[ExportColumns.FINGERPRINT].tolist()
+            # Append run: log only this batch instead of re-serializing the
+            # whole (stable, growing) state
+            append_exported_state(
+                set(new_df[ExportColumns.ID].tolist()),
+                set(new_df[ExportColumns.FINGERPRINT].tolist()),
             )
-        save_exported_state(updated_ids, updated_fps)
 
     elif source == SOURCE_DATABASE:
         # Mark transactions as written in database
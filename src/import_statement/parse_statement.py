@@ -14,7 +14,7 @@ import os
 import pandas as pd
 
 from src.constants.config import CFG_PATHS
-from src.common.utils import LOG, load_yaml, parse_date_safe
+from src.common.utils import LOG, load_yaml, parse_date_series
 from src.import_statement.bank_config import BankConfig
 
 # Load configuration
@@ -118,7 +118,9 @@ def parse_csv(path):
 
     # Create output dataframe with basic columns
     out = pd.DataFrame()
-    out["date"] = df[col_map["date"]].apply(parse_date_safe)
+    # One vectorized pass for the whole column; only odd values fall back
+    # to the per-row parser inside parse_date_series
+    out["date"] = parse_date_series(df[col_map["date"]])
     out["description"] = df[col_map["description"]].astype(str).str.strip()
     # Don't take absolute value yet - we need to filter credits first
     out["amount"] = df[col_map["amount"]].apply(parse_amount_safe)
@@ -7,6 +7,7 @@ current category) and update them to a new category in bulk.
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -22,7 +23,6 @@ from src.constants.export_columns import ExportColumns
 from src.constants.splitwise import SUBCATEGORY_IDS
 from src.common.utils import LOG
 
-
 # Alias the constant for backward compatibility
 COMMON_SUBCATEGORIES = SUBCATEGORY_IDS
 
@@ -54,13 +54,16 @@ def find_expenses_to_update(
         f"Retrieved {len(df)} total expenses from {start_date.date()} to {end_date.date()}"
     )
 
-    # Apply filters
-    filtered = df.copy()
+    # Apply filters; each mask below produces a new frame, so no upfront
+    # defensive copy of the full fetch is needed
+    filtered = df
 
     if merchant_filter:
+        # Plain substring match: regex=False takes the str.find fast path
+        # and avoids compiling the filter text as a pattern
         filtered = filtered[
             filtered[ExportColumns.DESCRIPTION].str.contains(
-                merchant_filter, case=False, na=False
+                merchant_filter, case=False, na=False, regex=False
             )
         ]
         LOG.info(f"After merchant filter '{merchant_filter}': {len(filtered)} expenses")
@@ -68,20 +71,20 @@ def find_expenses_to_update(
     if exclude_merchant:
         filtered = filtered[
             ~filtered[ExportColumns.DESCRIPTION].str.contains(
-                exclude_merchant, case=False, na=False
+                exclude_merchant, case=False, na=False, regex=False
             )
         ]
         LOG.info(f"After excluding '{exclude_merchant}': {len(filtered)} expenses")
 
     if current_category_filter:
-        # Support both "Category" and "Category - Subcategory" formats
-        filtered = filtered[
-            (filtered[ExportColumns.CATEGORY].str.strip() == current_category_filter)
-            | (
-                filtered[ExportColumns.CATEGORY].str.strip()
-                == current_category_filter.replace(" > ", " - ")
-            )
-        ]
+        # Support both "Category" and "Category - Subcategory" formats.
+        # Strip once and compare against both accepted spellings in a single
+        # hashed isin pass instead of two equality scans.
+        accepted = {
+            current_category_filter,
+            current_category_filter.replace(" > ", " - "),
+        }
+        filtered = filtered[filtered[ExportColumns.CATEGORY].str.strip().isin(accepted)]
         LOG.info(
             f"After category filter '{current_category_filter}': {len(filtered)} expenses"
         )
@@ -94,14 +97,20 @@ def update_expenses(
     expenses_df,
     new_subcategory_id: int,
     dry_run: bool = False,
+    max_workers: int = 8,
 ):
     """Update expenses to the new category.
 
+    The per-expense getExpense/updateExpense round-trips are pure network
+    latency, so they run on a bounded thread pool. The worker count is kept
+    modest to stay within Splitwise API rate limits.
+
     Args:
         client: SplitwiseClient instance
         expenses_df: DataFrame of expenses to update
         new_subcategory_id: The subcategory ID to set
         dry_run: If True, only show what would be updated
+        max_workers: Number of concurrent update calls
 
     Returns:
         Number of expenses updated
@@ -118,8 +127,7 @@ def update_expenses(
         f"Updating {len(expenses_df)} expenses to subcategory ID {new_subcategory_id}"
     )
 
-    updated_count = 0
-    for _, row in expenses_df.iterrows():
+    def _update_one(row) -> bool:
         exp_id = row[ExportColumns.ID]
         try:
             exp = client.sObj.getExpense(exp_id)
@@ -133,9 +141,13 @@ def update_expenses(
             LOG.info(
                 f"Updated expense {exp_id}: {row[ExportColumns.DESCRIPTION]} ({row[ExportColumns.DATE]})"
             )
-            updated_count += 1
+            return True
         except Exception as e:
             LOG.error(f"Failed to update expense {exp_id}: {str(e)}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        updated_count = sum(executor.map(_update_one, expenses_df.to_dict("records")))
 
     return updated_count
 
@@ -209,6 +221,12 @@ See src/constants/splitwise.py for full list of available subcategory IDs.
         help="New subcategory name (predefined mappings)",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Concurrent update requests (default: %(default)s; keep modest for API rate limits)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -298,6 +316,7 @@ See src/constants/splitwise.py for full list of available subcategory IDs.
         expenses_to_update,
         new_subcategory_id,
         dry_run=args.dry_run,
+        max_workers=args.max_workers,
     )
 
     if args.dry_run:
@@ -7,6 +7,7 @@ two self accounts, when they should be 100% owed to properly reflect the full ex
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 import pandas as pd
@@ -21,7 +22,11 @@ from src.common.utils import LOG, parse_date_string
 
 
 def update_self_expense(
-    client: SplitwiseClient, expense_id: int, amount: float, my_user_id: int
+    client: SplitwiseClient,
+    expense_id: int,
+    amount: float,
+    my_user_id: int,
+    expense_obj=None,
 ) -> bool:
     """Update a self expense to be 100% owed instead of 50/50 split.
 
@@ -30,13 +35,16 @@ def update_self_expense(
         expense_id: The Splitwise expense ID to update
         amount: The total expense amount
         my_user_id: The current user's Splitwise ID
+        expense_obj: Already-fetched expense object, if the caller has one;
+            saves a getExpense round-trip
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Get the expense object
-        expense_obj = client.sObj.getExpense(expense_id)
+        # Get the expense object unless the caller prefetched it
+        if expense_obj is None:
+            expense_obj = client.sObj.getExpense(expense_id)
 
         # Verify participants include current user and exactly one other
         users = expense_obj.getUsers() or []
@@ -110,6 +118,12 @@ def main():
         help="Specific Splitwise expense ID to update (updates only this transaction)",
         default=None,
     )
+    parser.add_argument(
+        "--yes",
+        "-y",
+        action="store_true",
+        help="Skip confirmation prompt (for non-interactive/scripted runs)",
+    )
 
     args = parser.parse_args()
 
@@ -151,15 +165,19 @@ def main():
             )
             return
 
-        # Confirm with user before making change
-        response = input(
-            f"\nUpdate expense {expense_id} to full-share format? (yes/no): "
-        )
-        if response.lower() not in ["yes", "y"]:
-            LOG.info("Update cancelled for expense %s", expense_id)
-            return
+        # Confirm with user before making change (unless --yes)
+        if not args.yes:
+            response = input(
+                f"\nUpdate expense {expense_id} to full-share format? (yes/no): "
+            )
+            if response.lower() not in ["yes", "y"]:
+                LOG.info("Update cancelled for expense %s", expense_id)
+                return
 
-        success = update_self_expense(client, expense_id, amount, my_user_id)
+        # Reuse the expense object fetched above rather than re-fetching it
+        success = update_self_expense(
+            client, expense_id, amount, my_user_id, expense_obj=expense_obj
+        )
         if success:
             LOG.info("Updated expense %s", expense_id)
         else:
@@ -169,7 +187,19 @@ def main():
     # Get expenses
     if args.use_csv:
         LOG.info(f"Loading expenses from CSV: {args.use_csv}")
-        df = pd.read_csv(args.use_csv)
+        # Project only the columns this script reads; the exported CSV
+        # carries many more object columns that would just inflate memory.
+        # The callable form tolerates exports missing optional columns.
+        needed = {
+            ExportColumns.ID,
+            ExportColumns.DATE,
+            ExportColumns.AMOUNT,
+            ExportColumns.DESCRIPTION,
+            ExportColumns.SPLIT_TYPE,
+            ExportColumns.PARTICIPANT_NAMES,
+            ExportColumns.FRIENDS_SPLIT,
+        }
+        df = pd.read_csv(args.use_csv, usecols=lambda col: col in needed)
     else:
         LOG.info("Fetching expenses from Splitwise API...")
         df = client.get_my_expenses_by_date_range(start_date, end_date)
@@ -191,42 +221,30 @@ def main():
         f"Filtering for expenses between user {my_user_id} and self-expense user {self_user_id}"
     )
 
-    def is_self_split_expense(row):
-        """Check if expense is between main user and self-expense user."""
-        try:
-            # Parse the friends_split field to get participant user IDs
-            if pd.isna(row.get(ExportColumns.FRIENDS_SPLIT, "")):
-                return False
-
-            participants = row[ExportColumns.FRIENDS_SPLIT].split("; ")
-            user_ids = set()
-
-            for p in participants:
-                # Format: "Name|paid=X|owed=Y"
-                parts = p.split("|")
-                if parts:
-                    name = parts[0].strip()
-                    # Check if this participant matches our known users
-                    # Since we can't extract user_id from this format easily,
-                    # we'll check if it's exactly 2 participants with same name
-                    user_ids.add(name)
-
-            # Self expenses have exactly 2 entries with the same name (or "Balaji, Balaji" pattern)
-            participant_names = row.get(ExportColumns.PARTICIPANT_NAMES, "")
-            return (
-                row.get(ExportColumns.SPLIT_TYPE) == SPLIT_TYPE_SELF
-                and "," in participant_names
-                and len(participant_names.split(",")) == 2
-                and participant_names.split(",")[0].strip()
-                == participant_names.split(",")[1].strip()
-            )
-        except Exception as e:
-            LOG.debug(
-                f"Error checking expense {row.get(ExportColumns.ID, 'unknown')}: {str(e)}"
+    # A self-split row has split_type "self" and exactly two identical
+    # participant names ("Balaji, Balaji"). Composed as vectorized masks
+    # instead of a per-row apply callback; rows lacking the columns (or with
+    # a missing friends_split) simply never match, as before.
+    if (
+        ExportColumns.SPLIT_TYPE in df.columns
+        and ExportColumns.PARTICIPANT_NAMES in df.columns
+    ):
+        names = df[ExportColumns.PARTICIPANT_NAMES].fillna("").astype(str)
+        halves = names.str.split(",", n=1, expand=True)
+        if halves.shape[1] < 2:
+            mask = pd.Series(False, index=df.index)
+        else:
+            mask = (
+                df[ExportColumns.SPLIT_TYPE].eq(SPLIT_TYPE_SELF)
+                & names.str.count(",").eq(1)
+                & halves[0].str.strip().eq(halves[1].fillna("").str.strip())
             )
-            return False
+        if ExportColumns.FRIENDS_SPLIT in df.columns:
+            mask &= df[ExportColumns.FRIENDS_SPLIT].notna()
+    else:
+        mask = pd.Series(False, index=df.index)
 
-    self_expenses = df[df.apply(is_self_split_expense, axis=1)].copy()
+    self_expenses = df[mask].copy()
 
     if self_expenses.empty:
         LOG.info("No self expenses found in date range")
@@ -245,35 +263,54 @@ def main():
 
     if args.dry_run:
         LOG.info("\n=== DRY RUN MODE - No changes will be made ===\n")
-        for _, expense in self_expenses.iterrows():
+        # itertuples over just the printed columns: no per-row Series
+        # construction like iterrows. Positional access because the column
+        # names aren't valid identifiers.
+        summary_cols = self_expenses[
+            [
+                ExportColumns.ID,
+                ExportColumns.DATE,
+                ExportColumns.AMOUNT,
+                ExportColumns.DESCRIPTION,
+            ]
+        ]
+        for exp_id, exp_date, exp_amount, exp_desc in summary_cols.itertuples(
+            index=False, name=None
+        ):
             LOG.info(
-                f"Would update: ID={expense[ExportColumns.ID]}, "
-                f"Date={expense[ExportColumns.DATE][:10]}, "
-                f"Amount=${expense[ExportColumns.AMOUNT]:.2f}, "
-                f"Description={expense[ExportColumns.DESCRIPTION]}"
+                f"Would update: ID={exp_id}, "
+                f"Date={exp_date[:10]}, "
+                f"Amount=${exp_amount:.2f}, "
+                f"Description={exp_desc}"
             )
         LOG.info(f"\nTotal: {len(self_expenses)} expenses would be updated")
         return
 
-    # Confirm with user
-    response = input(f"\nUpdate {len(self_expenses)} self expenses? (yes/no): ")
-    if response.lower() not in ["yes", "y"]:
-        LOG.info("Update cancelled")
-        return
+    # Confirm with user (unless --yes)
+    if not args.yes:
+        response = input(f"\nUpdate {len(self_expenses)} self expenses? (yes/no): ")
+        if response.lower() not in ["yes", "y"]:
+            LOG.info("Update cancelled")
+            return
 
-    # Update expenses
+    # Update expenses. Each update is a getExpense + updateExpense round
+    # trip, so overlap them on a small thread pool (bounded to stay within
+    # Splitwise API rate limits).
     LOG.info("\nUpdating expenses...")
-    success_count = 0
-    fail_count = 0
 
-    for _, expense in self_expenses.iterrows():
-        expense_id = int(expense[ExportColumns.ID])
-        amount = float(expense[ExportColumns.AMOUNT])
+    def _do_update(expense) -> bool:
+        return update_self_expense(
+            client,
+            int(expense[ExportColumns.ID]),
+            float(expense[ExportColumns.AMOUNT]),
+            my_user_id,
+        )
 
-        if update_self_expense(client, expense_id, amount, my_user_id):
-            success_count += 1
-        else:
-            fail_count += 1
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_do_update, self_expenses.to_dict("records")))
+
+    success_count = sum(results)
+    fail_count = len(results) - success_count
 
     # Summary
     LOG.info(f"\n=== Update Complete ===")